@@ -1,12 +1,45 @@
 from flask import Flask, request, render_template, send_from_directory, redirect, url_for
 import os
-from resume_filter import ResumeFilter  # Your main resume filter class
+from resume_filter import ResumeFilter, WorkerPool  # Your main resume filter class
 import tempfile
 import shutil
+import hashlib
+import time
 
 app = Flask(__name__)
 UPLOAD_FOLDER = 'uploads'
+# Scratch space for incoming uploads: a sibling of UPLOAD_FOLDER (same filesystem,
+# so matches move with a rename) that is never served by /download
+UPLOAD_TMP_FOLDER = 'uploads_tmp'
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+os.makedirs(UPLOAD_TMP_FOLDER, exist_ok=True)
+# Stored matches hold personal data and are only linked from a results page,
+# so drop anything that hasn't been uploaded again within a day
+UPLOAD_MAX_AGE = 24 * 60 * 60
+
+# Shared worker pool so each request doesn't pay process startup cost;
+# it replaces itself if a worker crashes on a bad upload
+worker_pool = WorkerPool()
+
+def _file_sha1(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _sweep_uploads():
+    # Remove stored resumes older than UPLOAD_MAX_AGE so the folder stays bounded
+    cutoff = time.time() - UPLOAD_MAX_AGE
+    with os.scandir(UPLOAD_FOLDER) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
 
 @app.route('/', methods=['GET', 'POST'])
 def upload():
@@ -18,23 +51,32 @@ def upload():
 
         resume_filter = ResumeFilter(job_description, mandatory_keywords, optional_keywords, min_experience)
 
-        temp_dir = tempfile.mkdtemp()
-        uploaded_files = []
+        temp_dir = tempfile.mkdtemp(dir=UPLOAD_TMP_FOLDER)
+        try:
+            uploaded_files = []
 
-        for file in request.files.getlist('resumes'):
-            filepath = os.path.join(temp_dir, file.filename)
-            file.save(filepath)
-            uploaded_files.append((file.filename, filepath))
+            for file in request.files.getlist('resumes'):
+                filepath = os.path.join(temp_dir, file.filename)
+                file.save(filepath)
+                uploaded_files.append((file.filename, filepath))
 
-        results = resume_filter.process_resumes(temp_dir)
+            results = resume_filter.process_resumes(temp_dir, pool=worker_pool)
 
-        # Copy matching resumes to UPLOAD_FOLDER for download
-        for res in results:
-            original_path = os.path.join(temp_dir, res['filename'])
-            dest_path = os.path.join(UPLOAD_FOLDER, res['filename'])
-            shutil.copyfile(original_path, dest_path)
+            # Move matching resumes to UPLOAD_FOLDER for download; the content-hash
+            # prefix keeps different files with the same name apart while the same
+            # file uploaded again reuses its existing copy
+            for res in results:
+                original_path = os.path.join(temp_dir, res['filename'])
+                res['stored_filename'] = f"{_file_sha1(original_path)}_{res['filename']}"
+                stored_path = os.path.join(UPLOAD_FOLDER, res['stored_filename'])
+                if os.path.exists(stored_path):
+                    os.utime(stored_path)
+                else:
+                    shutil.move(original_path, stored_path)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
-        shutil.rmtree(temp_dir)
+        _sweep_uploads()
 
         return render_template('results.html', resumes=results, min_experience=min_experience, job_description=job_description)
 
@@ -43,7 +85,9 @@ def upload():
 
 @app.route('/download/<path:filename>')
 def download_resume(filename):
-    return send_from_directory(UPLOAD_FOLDER, filename, as_attachment=True)
+    # Strip the content-hash prefix added on upload from the downloaded file's name
+    download_name = filename.split('_', 1)[-1]
+    return send_from_directory(UPLOAD_FOLDER, filename, as_attachment=True, download_name=download_name)
 
 if __name__ == '__main__':
     app.run(debug=True)
@@ -1,11 +1,229 @@
+import hashlib
+import io
 import os
 import re
-import pdfplumber
+import subprocess
+import threading
+import time
+import ahocorasick
+import docx2txt
+import fitz  # PyMuPDF
 import pytesseract
-from docx import Document
+from cachetools import LRUCache
 from pdf2image import convert_from_path
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import islice
+
+# PDFs whose text layer yields fewer characters than this are treated as scans
+_MIN_TEXT_CHARS = 50
+# First-page probe: scans tend to give almost no text, or mostly non-letter garbage
+_MIN_PROBE_CHARS = 20
+_MIN_ALPHA_RATIO = 0.5
+# LSTM engine with a single uniform text block is the fastest Tesseract mode
+_TESSERACT_CONFIG = '--oem 1 --psm 6'
+# Grayscale 150 DPI renders are enough for Tesseract and much smaller than 200 DPI RGB
+_OCR_DPI = 150
+# Seconds before an external converter (pdftotext, pdftoppm, tesseract, antiword) is given up on
+_SUBPROCESS_TIMEOUT = 60
+# Per-file OCR parallelism; files already run in one worker process per core
+_OCR_THREADS = 2
+
+# Files read ahead of the parser; bounds memory held in raw file bytes
+_PREFETCH_WINDOW = 2 * (os.cpu_count() or 1)
+
+# Extracted text is cached on disk by SHA-1 of the file contents plus the
+# extractor version; bump the version whenever extraction output changes.
+# Retention: the cache holds resume text (personal data), so on every write
+# entries older than _CACHE_MAX_AGE seconds, entries from other versions and
+# the oldest entries beyond _CACHE_MAX_ENTRIES are deleted.
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'resumefilter')
+_CACHE_VERSION = 2
+_CACHE_MAX_AGE = 7 * 24 * 60 * 60
+_CACHE_MAX_ENTRIES = 500
+
+# Analyses keyed by (content hash, keywords, min experience); None marks a rejected resume.
+# Files whose extraction produced no text are never cached so they are retried.
+_ANALYSIS_CACHE = LRUCache(maxsize=1000)
+_ANALYSIS_CACHE_LOCK = threading.Lock()
+_MISSING = object()
+
+# Common patterns for experience, in priority order; compiled once so each
+# call only pays for the scan itself
+_EXP_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+\.?\d*)\s*(?:years?|yrs?)\s*(?:experience|exp)',
+    r'experience\s*:\s*(\d+\.?\d*)\s*(?:years?|yrs?)',
+    r'(\d+)\+?\s*(?:years?|yrs?)\s*in\s*.*(?:experience|exp)',
+    r'(\d+\.?\d*)\s*(?:years?|yrs?)\s*professional',
+    r'(\d+)\s*(?:years?|yrs?)\s*relevant'
+))
+_DATE_RE = re.compile(r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s*\d{4}\s*[-–—]\s*(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s*\d{4}|\bpresent\b', re.IGNORECASE)
+_DATE_SPLIT_RE = re.compile(r'\s*[-–—]\s*')
+_MONTHS = {'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+           'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12}
+
+
+def _parse_month_year(date):
+    """Parse e.g. 'Jan 2020' or 'January 2020' to the first of that month"""
+    return datetime(int(date[-4:]), _MONTHS[date[:3].lower()], 1)
+
+
+def _is_word_char(c):
+    return c.isalnum() or c == '_'
+
+
+def _lowercase(text):
+    """Lowercase text without changing its length, so offsets stay valid"""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # A few characters (e.g. 'İ') grow when lowercased; leave those as they are
+        lowered = ''.join(c.lower() if len(c.lower()) == 1 else c for c in text)
+    return lowered
+
+
+def _cache_path(digest):
+    return os.path.join(_CACHE_DIR, f"{digest}.v{_CACHE_VERSION}.txt")
+
+
+@lru_cache(maxsize=256)
+def _read_cached_text(digest):
+    """Return cached text for a content hash; raises OSError on a miss"""
+    with open(_cache_path(digest), encoding='utf-8') as f:
+        return f.read()
+
+
+def _write_cached_text(digest, text):
+    """Atomically store text for a content hash"""
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    path = _cache_path(digest)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    _prune_cache()
+
+
+def _prune_cache():
+    """Apply the cache retention rules described at _CACHE_DIR"""
+    suffix = f".v{_CACHE_VERSION}.txt"
+    now = time.time()
+    entries = []
+    for entry in os.scandir(_CACHE_DIR):
+        try:
+            mtime = entry.stat().st_mtime
+            expired = now - mtime > _CACHE_MAX_AGE
+            if entry.name.endswith(suffix) and not expired:
+                entries.append((mtime, entry.path))
+            elif expired or not entry.name.endswith('.tmp'):
+                # Recent .tmp files may belong to a write in progress
+                os.remove(entry.path)
+        except FileNotFoundError:
+            continue  # Removed concurrently by another worker
+    entries.sort()
+    for _, path in entries[:max(0, len(entries) - _CACHE_MAX_ENTRIES)]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _collect_analysis(key, future):
+    """Wait for a worker result and remember it under key (if any and cacheable)"""
+    cacheable, analysis = future.result()
+    if key is not None and cacheable:
+        with _ANALYSIS_CACHE_LOCK:
+            _ANALYSIS_CACHE[key] = analysis
+    return analysis
+
+
+def _looks_scanned(page_text):
+    """Heuristic for a page with no real text layer"""
+    chars = ''.join(page_text.split())
+    if len(chars) < _MIN_PROBE_CHARS:
+        return True
+    return sum(c.isalpha() for c in chars) / len(chars) < _MIN_ALPHA_RATIO
+
+
+def _pdftotext(filepath):
+    """Text from poppler's pdftotext, or "" if it is unavailable or fails"""
+    # -raw keeps content-stream order and skips layout analysis, which keyword matching doesn't need
+    try:
+        result = subprocess.run(['pdftotext', '-raw', '-nopgbrk', '-enc', 'UTF-8', filepath, '-'],
+                                capture_output=True, encoding='utf-8', errors='replace',
+                                timeout=_SUBPROCESS_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    return result.stdout if result.returncode == 0 else ""
+
+
+def _read_bytes(filepath):
+    try:
+        with open(filepath, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None  # extract_text reports the error
+
+
+def _prefetch(filepaths, window=_PREFETCH_WINDOW):
+    """Yield (filepath, bytes) in order while reading up to window files ahead"""
+    paths = iter(filepaths)
+    with ThreadPoolExecutor(max_workers=2) as io_pool:
+        pending = deque((path, io_pool.submit(_read_bytes, path)) for path in islice(paths, window))
+        while pending:
+            path, future = pending.popleft()
+            for next_path in islice(paths, 1):
+                pending.append((next_path, io_pool.submit(_read_bytes, next_path)))
+            yield path, future.result()
+
+
+def _process_one(resume_filter, filepath, data):
+    """
+    Extract and analyze a single resume (runs in a worker process)
+    Returns: (cacheable, analysis) where analysis is None for a skipped resume
+    """
+    text = resume_filter.extract_text(filepath, data)
+    if not text.strip():
+        # Skip empty files, but don't cache: extraction may have failed
+        return False, None
+    lowered = _lowercase(text)
+    if not resume_filter._quick_mandatory_check(lowered):
+        return True, None  # Rejected without the full scoring pass
+    return True, resume_filter.analyze_resume(text, lowered)
+
+
+class WorkerPool:
+    """
+    Process pool that can be shared across calls (e.g. Flask requests).
+    If a worker dies (a parser crash or the OOM killer), ProcessPoolExecutor
+    rejects all further work; the broken executor is then swapped for a
+    fresh one so later submissions still run.
+    """
+    def __init__(self, max_workers=None):
+        self._max_workers = max_workers or os.cpu_count()
+        self._lock = threading.Lock()
+        self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+    
+    def submit(self, fn, *args):
+        with self._lock:
+            executor = self._executor
+        try:
+            return executor.submit(fn, *args)
+        except BrokenProcessPool:
+            with self._lock:
+                # Another thread may have replaced it already
+                if self._executor is executor:
+                    self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+                    executor.shutdown(wait=False)
+                executor = self._executor
+            return executor.submit(fn, *args)
+    
+    def shutdown(self):
+        with self._lock:
+            self._executor.shutdown()
+
 
 class ResumeFilter:
     def __init__(self, job_description, mandatory_keywords, optional_keywords, min_experience):
@@ -17,66 +235,129 @@ class ResumeFilter:
         - min_experience: Minimum years of experience required (float)
         """
         self.job_description = job_description
-        self.mandatory = [kw.lower() for kw in mandatory_keywords]
-        self.optional = [kw.lower() for kw in optional_keywords]
+        self.mandatory = [kw.strip().lower() for kw in mandatory_keywords if kw.strip()]
+        self.optional = [kw.strip().lower() for kw in optional_keywords if kw.strip()]
         self.min_experience = min_experience
         
-    def extract_text(self, filepath):
-        """Extract text from PDF or DOCX file (whole document)"""
+        # Single automaton over all keywords so each resume is scanned once.
+        # Each keyword records whether its first/last character is a word
+        # character; only those edges need a word boundary (like \b) in the text.
+        self._mandatory_set = set(self.mandatory)
+        self._optional_set = set(self.optional)
+        self._automaton = ahocorasick.Automaton()
+        for kw in dict.fromkeys(self.mandatory + self.optional):
+            self._automaton.add_word(kw, (kw, _is_word_char(kw[0]), _is_word_char(kw[-1])))
+        if self._automaton:
+            self._automaton.make_automaton()
+        
+        # Everything besides file contents that affects analyze_resume's result
+        self._analysis_params = (tuple(sorted(self.mandatory)), tuple(sorted(self.optional)), min_experience)
+    
+    def _analysis_key(self, data):
+        if data is None:
+            return None
+        return (hashlib.sha1(data).hexdigest(),) + self._analysis_params
+    
+    def _quick_mandatory_check(self, lowered):
+        """
+        Cheap substring test that every mandatory keyword occurs somewhere in
+        the lowercased text; analyze_resume still applies the boundary checks
+        """
+        return all(kw in lowered for kw in self.mandatory)
+        
+    def extract_text(self, filepath, data=None):
+        """
+        Extract text from PDF or DOCX file (whole document), reusing
+        the cached text when the same file contents were seen before.
+        data may hold the file's bytes if they were already read.
+        """
+        if data is None:
+            try:
+                with open(filepath, 'rb') as f:
+                    data = f.read()
+            except OSError as e:
+                print(f"Error processing {filepath}: {e}")
+                return ""
+        digest = hashlib.sha1(data).hexdigest()
+        
+        try:
+            return _read_cached_text(digest)
+        except OSError:
+            pass
+        
+        text, complete = self._extract_text_uncached(filepath, data)
+        # Partial results (e.g. OCR failed after a short text layer) are retried next time
+        if complete and text.strip():
+            try:
+                _write_cached_text(digest, text)
+            except OSError as e:
+                print(f"Could not cache text for {filepath}: {e}")
+        return text
+    
+    def _extract_text_uncached(self, filepath, data):
+        """
+        Extract text from PDF or DOCX file (whole document)
+        Returns: (text, complete) where complete is False if extraction failed part way
+        """
         text = ""
+        complete = False
         try:
             if filepath.lower().endswith('.pdf'):
-                # First try pdfplumber
-                with pdfplumber.open(filepath) as pdf:
-                    text = "\n".join([page.extract_text() or "" for page in pdf.pages])
+                # First try the PDF's own text layer, unless the first page
+                # already shows it's a scan
+                with fitz.open(stream=data, filetype='pdf') as pdf:
+                    first_page = pdf[0].get_text("text") if pdf.page_count else ""
+                    if not _looks_scanned(first_page):
+                        # Document.pages(1) raises on one-page PDFs, so index the rest directly
+                        rest = (pdf[i].get_text("text") for i in range(1, pdf.page_count))
+                        text = "\n".join([first_page, *rest])
+                
+                # pdftotext copes with some font encodings MuPDF can't decode
+                if len(text.strip()) < _MIN_TEXT_CHARS:
+                    text = _pdftotext(filepath)
                 
-                # Fallback to OCR if needed
-                if not text.strip():
-                    images = convert_from_path(filepath)
-                    text = "\n".join([pytesseract.image_to_string(img) for img in images])
+                # Fallback to OCR only for scanned PDFs without a usable text layer
+                if len(text.strip()) < _MIN_TEXT_CHARS:
+                    images = convert_from_path(filepath, dpi=_OCR_DPI, grayscale=True,
+                                               thread_count=_OCR_THREADS, fmt='jpeg',
+                                               timeout=_SUBPROCESS_TIMEOUT)
+                    # pytesseract runs tesseract as a subprocess, so threads OCR pages in parallel
+                    ocr = partial(pytesseract.image_to_string, config=_TESSERACT_CONFIG,
+                                  timeout=_SUBPROCESS_TIMEOUT)
+                    with ThreadPoolExecutor(max_workers=_OCR_THREADS) as ex:
+                        text = "\n".join(ex.map(ocr, images))
+            
+            elif filepath.lower().endswith('.docx'):
+                # Parses word/document.xml directly (paragraphs and tables)
+                text = docx2txt.process(io.BytesIO(data)) or ""
             
-            elif filepath.lower().endswith(('.docx', '.doc')):
-                doc = Document(filepath)
-                full_text = []
-                for para in doc.paragraphs:
-                    full_text.append(para.text)
-                for table in doc.tables:
-                    for row in table.rows:
-                        for cell in row.cells:
-                            full_text.append(cell.text)
-                text = "\n".join(full_text)
+            elif filepath.lower().endswith('.doc'):
+                # Legacy binary Word format needs antiword
+                # A timeout raises and is handled as a failed extraction below
+                result = subprocess.run(['antiword', filepath], capture_output=True, text=True,
+                                        timeout=_SUBPROCESS_TIMEOUT)
+                text = result.stdout
+            
+            complete = True
                 
         except Exception as e:
             print(f"Error processing {filepath}: {e}")
         
-        return text.lower()  # Normalize to lowercase
+        return text, complete
 
     def extract_experience(self, text):
         """
         Extract total years of experience from resume text
         Returns: float (years of experience) or None if not found
         """
-        # Common patterns for experience
-        patterns = [
-            r'(\d+\.?\d*)\s*(years?|yrs?)\s*(experience|exp)',
-            r'experience\s*:\s*(\d+\.?\d*)\s*(years?|yrs?)',
-            r'(\d+)\+?\s*(years?|yrs?)\s*in\s*.*(experience|exp)',
-            r'(\d+\.?\d*)\s*(years?|yrs?)\s*professional',
-            r'(\d+)\s*(years?|yrs?)\s*relevant'
-        ]
-        
         # Search for explicit experience statements
-        for pattern in patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                try:
-                    return float(match.group(1))
-                except:
-                    continue
+        for pattern in _EXP_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                return float(match.group(1))
         
         # If no explicit experience found, try to calculate from dates
-        date_pattern = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s*\d{4}\s*[-–—]\s*(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\s*\d{4}|\bpresent\b'
-        date_ranges = re.findall(date_pattern, text, flags=re.IGNORECASE)
+        date_ranges = _DATE_RE.findall(text)
         
         total_experience = 0
         valid_ranges = 0
@@ -84,7 +365,7 @@ class ResumeFilter:
         for date_range in date_ranges:
             try:
                 # Split date range
-                dates = re.split(r'\s*[-–—]\s*', date_range)
+                dates = _DATE_SPLIT_RE.split(date_range)
                 if len(dates) != 2:
                     continue
                     
@@ -92,13 +373,13 @@ class ResumeFilter:
                 start_date = dates[0].strip()
                 end_date = dates[1].strip()
                 
-                # Handle "Present" end date
+                # Parse dates, handling "Present" end date
+                start = _parse_month_year(start_date)
                 if end_date.lower() == "present":
-                    end_date = datetime.now().strftime("%b %Y")
-                
-                # Parse dates
-                start = datetime.strptime(start_date[:3] + " " + start_date[-4:], "%b %Y")
-                end = datetime.strptime(end_date[:3] + " " + end_date[-4:], "%b %Y")
+                    now = datetime.now()
+                    end = datetime(now.year, now.month, 1)
+                else:
+                    end = _parse_month_year(end_date)
                 
                 # Calculate duration in years
                 duration = (end - start).days / 365.25
@@ -114,49 +395,52 @@ class ResumeFilter:
         
         return None
 
-    def analyze_resume(self, text):
+    def analyze_resume(self, text, lowered=None):
         """
-        Analyze entire resume text and return:
+        Analyze entire resume text (lowered: its _lowercase() form, if already
+        computed) and return:
         - missing_mandatory: List of missing mandatory keywords
-        - keyword_counts: Dictionary of keyword frequencies
+        - keyword_counts: Dictionary of frequencies for keywords that were found
         - experience: Extracted years of experience
         - score: Total weighted score
         """
-        # Check for mandatory keywords
-        missing_mandatory = []
-        keyword_counts = defaultdict(int)
-        found_sections = defaultdict(list)
+        keyword_counts = {}
+        found_spans = defaultdict(list)
+        mandatory_score = 0
+        optional_score = 0
         
-        # Search for mandatory keywords throughout document
-        for kw in self.mandatory:
-            pattern = r'\b' + re.escape(kw) + r'\b'
-            matches = re.finditer(pattern, text)
-            count = 0
-            
-            for match in matches:
-                count += 1
-                # Capture surrounding context
-                start = max(0, match.start() - 50)
-                end = min(len(text), match.end() + 50)
-                context = text[start:end].replace('\n', ' ').strip()
-                found_sections[kw].append(context)
+        # End offset of the last counted hit per keyword
+        last_end = {}
+        
+        # One pass over the lowercased text finds every keyword occurrence
+        if lowered is None:
+            lowered = _lowercase(text)
+        matches = self._automaton.iter(lowered) if self._automaton else ()
+        for end_idx, (kw, word_start, word_end) in matches:
+            start_idx = end_idx - len(kw) + 1
+            # Keep whole-word hits only
+            if word_start and start_idx > 0 and _is_word_char(lowered[start_idx - 1]):
+                continue
+            if word_end and end_idx + 1 < len(lowered) and _is_word_char(lowered[end_idx + 1]):
+                continue
+            # The automaton reports overlapping hits; count non-overlapping ones like re.finditer
+            if start_idx < last_end.get(kw, 0):
+                continue
+            last_end[kw] = end_idx + 1
             
-            if count == 0:
-                missing_mandatory.append(kw)
-            keyword_counts[kw] = count
+            keyword_counts[kw] = keyword_counts.get(kw, 0) + 1
+            # Score as we count (mandatory 3x, optional 1x)
+            if kw in self._mandatory_set:
+                mandatory_score += 3
+                found_spans[kw].append((start_idx, end_idx + 1))
+            if kw in self._optional_set:
+                optional_score += 1
         
-        # Search for optional keywords
-        for kw in self.optional:
-            pattern = r'\b' + re.escape(kw) + r'\b'
-            keyword_counts[kw] = len(re.findall(pattern, text))
+        missing_mandatory = [kw for kw in self.mandatory if kw not in keyword_counts]
         
         # Extract experience
         experience = self.extract_experience(text)
         
-        # Calculate score (mandatory 3x, optional 1x)
-        mandatory_score = sum(keyword_counts[kw] * 3 for kw in self.mandatory)
-        optional_score = sum(keyword_counts[kw] for kw in self.optional)
-        
         # Experience bonus (up to 20% of total possible score)
         exp_bonus = 0
         if experience is not None and experience >= self.min_experience:
@@ -164,29 +448,79 @@ class ResumeFilter:
         
         total_score = mandatory_score + optional_score + exp_bonus
         
+        # Capture surrounding context once scoring is done, from the recorded offsets
+        found_sections = {
+            kw: [text[max(0, start - 50):min(len(text), end + 50)].replace('\n', ' ').strip() for start, end in spans]
+            for kw, spans in found_spans.items()
+        }
+        
         return {
             'missing_mandatory': missing_mandatory,
-            'keyword_counts': dict(keyword_counts),
-            'found_sections': dict(found_sections),
+            'keyword_counts': keyword_counts,
+            'found_sections': found_sections,
             'experience': experience,
             'score': total_score
         }
 
-    def process_resumes(self, resume_dir):
-        """Process all resumes in directory and return ranked results"""
+    def process_resumes(self, resume_dir, pool=None):
+        """
+        Process all resumes in directory and return ranked results.
+        Files are extracted and analyzed in parallel; pass an existing
+        WorkerPool to reuse its worker processes across calls.
+        """
         results = []
         
-        for filename in os.listdir(resume_dir):
-            if not filename.lower().endswith(('.pdf', '.docx', '.doc')):
-                continue
-                
-            filepath = os.path.join(resume_dir, filename)
-            text = self.extract_text(filepath)
+        filenames = [f for f in os.listdir(resume_dir) if f.lower().endswith(('.pdf', '.docx', '.doc'))]
+        filepaths = [os.path.join(resume_dir, f) for f in filenames]
+        
+        own_pool = pool is None
+        if own_pool:
+            pool = WorkerPool()
+        try:
+            # File reads are prefetched on I/O threads while workers parse;
+            # in-flight work is bounded so raw bytes don't pile up in memory.
+            # Resumes already analyzed with the same requirements are served from cache.
+            analyses = []
+            crashed = []
+            pending = deque()
             
-            if not text.strip():
-                continue  # Skip empty files
-                
-            analysis = self.analyze_resume(text)
+            def collect(key, filepath, data, future):
+                try:
+                    analyses.append(_collect_analysis(key, future))
+                except BrokenProcessPool:
+                    crashed.append((len(analyses), key, filepath, data))
+                    analyses.append(None)
+            
+            for filepath, data in _prefetch(filepaths):
+                key = self._analysis_key(data)
+                with _ANALYSIS_CACHE_LOCK:
+                    analysis = _ANALYSIS_CACHE.get(key, _MISSING) if key is not None else _MISSING
+                if analysis is _MISSING:
+                    future = pool.submit(_process_one, self, filepath, data)
+                else:
+                    future = Future()
+                    future.set_result((True, analysis))
+                    key = None
+                pending.append((key, filepath, data, future))
+                if len(pending) >= _PREFETCH_WINDOW:
+                    collect(*pending.popleft())
+            while pending:
+                collect(*pending.popleft())
+            
+            # A dead worker fails every file in flight with it; retry those one
+            # at a time so only the file that actually kills a worker is skipped
+            for index, key, filepath, data in crashed:
+                try:
+                    analyses[index] = _collect_analysis(key, pool.submit(_process_one, self, filepath, data))
+                except BrokenProcessPool:
+                    print(f"Error processing {filepath}: worker process crashed")
+        finally:
+            if own_pool:
+                pool.shutdown()
+        
+        for filename, analysis in zip(filenames, analyses):
+            if analysis is None:
+                continue
             
             # Only include resumes with all mandatory keywords
             if not analysis['missing_mandatory']:
@@ -204,7 +538,7 @@ class ResumeFilter:
                 })
         
         # Sort by score (highest first), then by experience met
-        results.sort(key=lambda x: (-x['score'], -x['experience_met']))
+        results.sort(key=lambda x: (-x['score'], not x['experience_met']))
         return results
 
 # Usage